@@ -44,7 +44,7 @@ class FileType(enum.Enum):
 
     @classmethod
     def has(cls, value: str) -> bool:
-        return value in cls.values()
+        return value in cls._value2member_map_
 
 
 @pydantic.dataclasses.dataclass
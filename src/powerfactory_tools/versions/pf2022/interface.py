@@ -38,7 +38,8 @@ from powerfactory_tools.versions.pf2022.types import ResultExportMode
 from powerfactory_tools.versions.pf2022.types import TimeSimulationNetworkCalcType
 from powerfactory_tools.versions.pf2022.types import TimeSimulationType
 from powerfactory_tools.versions.pf2022.types import UnitSystem
-from powerfactory_tools.versions.pf2022.types import ValidPFValue
+from powerfactory_tools.versions.pf2022.types import from_value
+from powerfactory_tools.versions.pf2022.types import is_valid_value
 from powerfactory_tools.versions.pf2022.utils.io import ExportHandler
 
 if t.TYPE_CHECKING:
@@ -47,6 +48,8 @@ if t.TYPE_CHECKING:
 
     import typing_extensions as te
 
+    from powerfactory_tools.versions.pf2022.types import ValidPFValue
+
     T = t.TypeVar("T")
 
 
@@ -231,21 +234,21 @@ class PowerFactoryInterface:
         loguru.logger.debug("Loading all project folders...")
         self.load_project_setting_folders_from_pf_db()
 
-        self.chars_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.CHARACTERISTICS.value))
-        self.grid_data_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.NETWORK_DATA.value))
-        self.grid_graphs_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.DIAGRAMS.value))
-        self.grid_model_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.NETWORK_MODEL.value))
-        self.grid_variant_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.VARIATIONS.value))
-        self.op_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.OPERATIONAL_LIBRARY.value))
-        self.study_case_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.STUDY_CASES.value))
+        self.chars_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.CHARACTERISTICS))
+        self.grid_data_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.NETWORK_DATA))
+        self.grid_graphs_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.DIAGRAMS))
+        self.grid_model_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.NETWORK_MODEL))
+        self.grid_variant_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.VARIATIONS))
+        self.op_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.OPERATIONAL_LIBRARY))
+        self.study_case_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.STUDY_CASES))
         self.scenario_dir = t.cast(
             "PFTypes.ProjectFolder",
-            self.app.GetProjectFolder(FolderType.OPERATION_SCENARIOS.value),
+            self.app.GetProjectFolder(FolderType.OPERATION_SCENARIOS),
         )
-        self.templates_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.TEMPLATES.value))
+        self.templates_dir = t.cast("PFTypes.ProjectFolder", self.app.GetProjectFolder(FolderType.TEMPLATES))
         self.types_dir = t.cast(
             "PFTypes.ProjectFolder",
-            self.app.GetProjectFolder(FolderType.EQUIPMENT_TYPE_LIBRARY.value),
+            self.app.GetProjectFolder(FolderType.EQUIPMENT_TYPE_LIBRARY),
         )
 
         self.ext_data_dir = self.project_settings.extDataDir
@@ -255,7 +258,7 @@ class PowerFactoryInterface:
         loguru.logger.debug("Loading settings from PowerFactory...")
         _settings_dirs = self.elements_of(
             self.project,
-            pattern="*." + PFClassId.SETTINGS_FOLDER.value,
+            pattern="*." + PFClassId.SETTINGS_FOLDER,
             recursive=False,
         )
         settings_dir = self.first_of(_settings_dirs)
@@ -270,7 +273,7 @@ class PowerFactoryInterface:
         loguru.logger.debug("Loading unit settings from PowerFactory...")
         _unit_settings_dirs = self.elements_of(
             self.settings_dir,
-            pattern="*." + PFClassId.SETTINGS_FOLDER_UNITS.value,
+            pattern="*." + PFClassId.SETTINGS_FOLDER_UNITS,
             recursive=False,
         )
         unit_settings_dir = self.first_of(_unit_settings_dirs)
@@ -326,10 +329,10 @@ class PowerFactoryInterface:
 
     @staticmethod
     def resolve_pf_error_code(error: PFTypes.PowerFactoryExitError) -> ErrorCode:
-        try:
-            return ErrorCode(error.code)
-        except ValueError:
-            return ErrorCode.UNKNOWN_ERROR_OCCURED
+        if is_valid_value(ErrorCode, error.code):
+            return from_value(ErrorCode, error.code)
+
+        return ErrorCode.UNKNOWN_ERROR_OCCURED
 
     def switch_study_case(self, study_case_name: str) -> PFTypes.StudyCase:
         study_case = self.study_case(study_case_name)
@@ -773,7 +776,7 @@ class PowerFactoryInterface:
         name: str = "*",
         /,
     ) -> Sequence[PFTypes.StudyCase]:
-        elements = self.elements_of(self.study_case_dir, pattern=name + "." + PFClassId.STUDY_CASE.value)
+        elements = self.elements_of(self.study_case_dir, pattern=name + "." + PFClassId.STUDY_CASE)
         return [t.cast("PFTypes.StudyCase", element) for element in elements]
 
     def scenario(
@@ -812,7 +815,7 @@ class PowerFactoryInterface:
         *,
         only_active: bool = False,
     ) -> Sequence[PFTypes.GridVariant]:
-        elements = self.elements_of(self.grid_variant_dir, pattern=name + "." + PFClassId.VARIANT.value)
+        elements = self.elements_of(self.grid_variant_dir, pattern=name + "." + PFClassId.VARIANT)
 
         if only_active:
             active_variants = self.app.GetActiveNetworkVariations()
@@ -893,7 +896,7 @@ class PowerFactoryInterface:
         return self.first_of(self.templates(name=name))
 
     def templates(self, name: str = "*") -> Sequence[PFTypes.Template]:
-        elements = self.elements_of(self.templates_dir, pattern=name + "." + PFClassId.TEMPLATE.value)
+        elements = self.elements_of(self.templates_dir, pattern=name + "." + PFClassId.TEMPLATE)
         return [t.cast("PFTypes.Template", element) for element in elements]
 
     def dsl_model(
@@ -914,7 +917,7 @@ class PowerFactoryInterface:
     ) -> Sequence[PFTypes.DslModel]:
         if location is None:
             location = self.grid_data_dir
-        elements = self.elements_of(location, pattern=name + "." + PFClassId.DSL_MODEL.value)
+        elements = self.elements_of(location, pattern=name + "." + PFClassId.DSL_MODEL)
         return [t.cast("PFTypes.DslModel", element) for element in elements]
 
     def line_type(
@@ -929,7 +932,7 @@ class PowerFactoryInterface:
         name: str = "*",
         /,
     ) -> Sequence[PFTypes.LineType]:
-        elements = self.equipment_type_elements(PFClassId.LINE_TYPE.value, name)
+        elements = self.equipment_type_elements(PFClassId.LINE_TYPE, name)
         return [t.cast("PFTypes.LineType", element) for element in elements]
 
     def load_type(
@@ -944,7 +947,7 @@ class PowerFactoryInterface:
         name: str = "*",
         /,
     ) -> Sequence[PFTypes.DataObject]:
-        elements = self.equipment_type_elements(PFClassId.LOAD_TYPE_GENERAL.value, name)
+        elements = self.equipment_type_elements(PFClassId.LOAD_TYPE_GENERAL, name)
         return [t.cast("PFTypes.LoadType", element) for element in elements]
 
     def transformer_2w_type(
@@ -959,7 +962,7 @@ class PowerFactoryInterface:
         name: str = "*",
         /,
     ) -> Sequence[PFTypes.Transformer2WType]:
-        elements = self.equipment_type_elements(PFClassId.TRANSFORMER_2W_TYPE.value, name)
+        elements = self.equipment_type_elements(PFClassId.TRANSFORMER_2W_TYPE, name)
         return [t.cast("PFTypes.Transformer2WType", element) for element in elements]
 
     def harmonic_source_type(
@@ -974,7 +977,7 @@ class PowerFactoryInterface:
         name: str = "*",
         /,
     ) -> Sequence[PFTypes.SourceTypeHarmonicCurrent]:
-        elements = self.equipment_type_elements(PFClassId.SOURCE_TYPE_HARMONIC_CURRENT.value, name)
+        elements = self.equipment_type_elements(PFClassId.SOURCE_TYPE_HARMONIC_CURRENT, name)
         return [t.cast("PFTypes.SourceTypeHarmonicCurrent", element) for element in elements]
 
     def area(
@@ -1483,7 +1486,7 @@ class PowerFactoryInterface:
         """
         study_case = self.study_case(only_active=True)
         if study_case is not None:
-            superior_grids = self.elements_of(study_case, pattern="*." + PFClassId.GRID.value)
+            superior_grids = self.elements_of(study_case, pattern="*." + PFClassId.GRID)
             return list(filter(lambda g: g not in superior_grids, self.grids(name, calc_relevant=calc_relevant)))
 
         return []
@@ -1633,7 +1636,7 @@ class PowerFactoryInterface:
 
     def unit_conversion_settings(self) -> Sequence[PFTypes.UnitConversionSetting]:
         if self.unit_settings_dir is not None:
-            elements = self.elements_of(self.unit_settings_dir, pattern="*." + PFClassId.UNIT_VARIABLE.value)
+            elements = self.elements_of(self.unit_settings_dir, pattern="*." + PFClassId.UNIT_VARIABLE)
             return [t.cast("PFTypes.UnitConversionSetting", element) for element in elements]
 
         return []
@@ -1986,7 +1989,7 @@ class PowerFactoryInterface:
             {PFTypes.DataObject | None} -- the created object
         """
 
-        _elements = self.elements_of(location, pattern=f"{name}.{class_name}")
+        _elements = self.elements_of(location, pattern=name + "." + class_name)
         element = self.first_of(_elements)
         if element is not None and not force:
             if not update:
@@ -2002,7 +2005,7 @@ class PowerFactoryInterface:
         if element is not None and data is not None and update:
             return self.update_object(element, data=data)
         # Update project folders if (new) object is not a VARIABLE_MONITOR
-        if class_name != PFClassId.VARIABLE_MONITOR.value:
+        if class_name != PFClassId.VARIABLE_MONITOR:
             self.load_project_folders_from_pf_db()
         return element
 
@@ -2045,7 +2048,7 @@ class PowerFactoryInterface:
         pf_type: PFClassId,
         /,
     ) -> bool:
-        return element.GetClassName() == pf_type.value
+        return element.GetClassName() == pf_type
 
     @staticmethod
     def is_of_types(
@@ -2053,10 +2056,10 @@ class PowerFactoryInterface:
         pf_types: Sequence[PFClassId],
         /,
     ) -> bool:
-        return element.GetClassName() in [pf_type.value for pf_type in pf_types]
+        return element.GetClassName() in pf_types
 
     def create_command(self, command_type: CalculationCommand) -> PFTypes.CommandBase:
-        return t.cast("PFTypes.CommandBase", self.app.GetFromStudyCase(command_type.value))
+        return t.cast("PFTypes.CommandBase", self.app.GetFromStudyCase(command_type))
 
     def create_ldf_command(
         self,
@@ -2079,11 +2082,11 @@ class PowerFactoryInterface:
         cmd = t.cast("PFTypes.CommandLoadFlow", self.create_command(CalculationCommand.LOAD_FLOW))
         if ac:
             if symmetrical:
-                cmd.iopt_net = NetworkExtendedCalcType.AC_SYM_POSITIVE_SEQUENCE.value  # type: ignore[assignment]
+                cmd.iopt_net = NetworkExtendedCalcType.AC_SYM_POSITIVE_SEQUENCE
             else:
-                cmd.iopt_net = NetworkExtendedCalcType.AC_UNSYM_ABC.value  # type: ignore[assignment]
+                cmd.iopt_net = NetworkExtendedCalcType.AC_UNSYM_ABC
         else:
-            cmd.iopt_net = NetworkExtendedCalcType.DC.value  # type: ignore[assignment]
+            cmd.iopt_net = NetworkExtendedCalcType.DC
 
         # update further attributes if needed
         if data is not None:
@@ -2118,12 +2121,12 @@ class PowerFactoryInterface:
             self.create_command(CalculationCommand.TIME_DOMAIN_SIMULATION_START),
         )
         # Set type of simulation (RMS, EMT)
-        cmd.iopt_sim = sim_type.value  # type: ignore[assignment]
+        cmd.iopt_sim = sim_type
         # Set type of network representation (symmetrical, unsymmetrical)
         if symmetrical:
-            cmd.iopt_net = TimeSimulationNetworkCalcType.AC_SYM_POSITIVE_SEQUENCE.value  # type: ignore[assignment]
+            cmd.iopt_net = TimeSimulationNetworkCalcType.AC_SYM_POSITIVE_SEQUENCE
         else:
-            cmd.iopt_net = TimeSimulationNetworkCalcType.AC_UNSYM_ABC.value  # type: ignore[assignment]
+            cmd.iopt_net = TimeSimulationNetworkCalcType.AC_UNSYM_ABC
         # Set result object to be used for simulation
         if result is not None:
             cmd.p_resvar = result
@@ -2183,7 +2186,7 @@ class PowerFactoryInterface:
         loguru.logger.debug("Create result export command {name} ...", name=name)
         if data is None:
             data = {}
-        data["iopt_exp"] = export_mode.value
+        data["iopt_exp"] = export_mode
 
         # specify file path if export mode requires a file
         if export_mode in [
@@ -2573,13 +2576,16 @@ class PowerFactoryInterface:
             cp_substat: PFTypes.Substation | None = getattr(element, "cpSubstat", None)
             if cp_substat is not None:
                 if PowerFactoryInterface.is_of_type(parent, PFClassId.SUBSTATION_FIELD):
-                    return cp_substat.loc_name + PATH_SEPARATOR + parent.loc_name + PATH_SEPARATOR + element_name
-
-                return cp_substat.loc_name + PATH_SEPARATOR + element_name
-
-            return parent.loc_name + PATH_SEPARATOR + element_name
+                    element_name = (
+                        cp_substat.loc_name + PATH_SEPARATOR + parent.loc_name + PATH_SEPARATOR + element_name
+                    )
+                else:
+                    element_name = cp_substat.loc_name + PATH_SEPARATOR + element_name
+            else:
+                element_name = parent.loc_name + PATH_SEPARATOR + element_name
 
-        return element_name
+        # the same terminal name is referenced by every element connected to it, so share one string object
+        return sys.intern(element_name)
 
     ## !
     ## The following may be part of version inconsistent behavior
@@ -2589,7 +2595,7 @@ class PowerFactoryInterface:
         load: PFTypes.LoadLV,
         /,
     ) -> Sequence[PFTypes.LoadLVP]:
-        elements = self.elements_of(load, pattern="*." + PFClassId.LOAD_LV_PART.value)
+        elements = self.elements_of(load, pattern="*." + PFClassId.LOAD_LV_PART)
         return [t.cast("PFTypes.LoadLVP", element) for element in elements]
 
     def load_lv(
@@ -0,0 +1,1411 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :author: Sebastian Krahmer <sebastian.krahmer@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2024.
+# :license: BSD 3-Clause
+
+from __future__ import annotations
+
+import typing as t
+from typing import Protocol
+
+if t.TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from powerfactory_tools.versions.pf2024.types import AttributeType
+    from powerfactory_tools.versions.pf2024.types import BusType
+    from powerfactory_tools.versions.pf2024.types import CalculationType
+    from powerfactory_tools.versions.pf2024.types import CosPhiChar
+    from powerfactory_tools.versions.pf2024.types import CtrlVoltageRef
+    from powerfactory_tools.versions.pf2024.types import Currency
+    from powerfactory_tools.versions.pf2024.types import ExternalQCtrlMode
+    from powerfactory_tools.versions.pf2024.types import FolderType
+    from powerfactory_tools.versions.pf2024.types import FuseCharacteristicType
+    from powerfactory_tools.versions.pf2024.types import GeneratorPhaseConnectionType
+    from powerfactory_tools.versions.pf2024.types import GeneratorSystemType
+    from powerfactory_tools.versions.pf2024.types import HarmonicLoadModelType
+    from powerfactory_tools.versions.pf2024.types import HarmonicSourceSystemType
+    from powerfactory_tools.versions.pf2024.types import IOpt
+    from powerfactory_tools.versions.pf2024.types import ISym
+    from powerfactory_tools.versions.pf2024.types import LoadFlowCtrlMode
+    from powerfactory_tools.versions.pf2024.types import LoadLVPhaseConnectionType
+    from powerfactory_tools.versions.pf2024.types import LoadPhaseConnectionType
+    from powerfactory_tools.versions.pf2024.types import LocalQCtrlMode
+    from powerfactory_tools.versions.pf2024.types import MetricPrefix
+    from powerfactory_tools.versions.pf2024.types import ModeInpGen
+    from powerfactory_tools.versions.pf2024.types import ModeInpLoad
+    from powerfactory_tools.versions.pf2024.types import ModeInpMV
+    from powerfactory_tools.versions.pf2024.types import NetworkCalcType
+    from powerfactory_tools.versions.pf2024.types import NetworkExtendedCalcType
+    from powerfactory_tools.versions.pf2024.types import NeutralPointEarthing
+    from powerfactory_tools.versions.pf2024.types import NodeType
+    from powerfactory_tools.versions.pf2024.types import PFRecap
+    from powerfactory_tools.versions.pf2024.types import PowerModelType
+    from powerfactory_tools.versions.pf2024.types import QChar
+    from powerfactory_tools.versions.pf2024.types import QOrient
+    from powerfactory_tools.versions.pf2024.types import ResultExportColumnHeadingElement
+    from powerfactory_tools.versions.pf2024.types import ResultExportColumnHeadingVariable
+    from powerfactory_tools.versions.pf2024.types import ResultExportIntervalFilter
+    from powerfactory_tools.versions.pf2024.types import ResultExportMode
+    from powerfactory_tools.versions.pf2024.types import ResultExportNumberFormat
+    from powerfactory_tools.versions.pf2024.types import ResultExportVariableSelection
+    from powerfactory_tools.versions.pf2024.types import SelectionTarget
+    from powerfactory_tools.versions.pf2024.types import SelectionType
+    from powerfactory_tools.versions.pf2024.types import ShuntNeutralConnectionType
+    from powerfactory_tools.versions.pf2024.types import ShuntPhaseConnectionType
+    from powerfactory_tools.versions.pf2024.types import ShuntType
+    from powerfactory_tools.versions.pf2024.types import TemperatureDependencyType
+    from powerfactory_tools.versions.pf2024.types import TerminalPhaseConnectionType
+    from powerfactory_tools.versions.pf2024.types import TerminalVoltageSystemType
+    from powerfactory_tools.versions.pf2024.types import TimeSimulationNetworkCalcType
+    from powerfactory_tools.versions.pf2024.types import TimeSimulationType
+    from powerfactory_tools.versions.pf2024.types import TrfNeutralConnectionType
+    from powerfactory_tools.versions.pf2024.types import TrfPhaseTechnology
+    from powerfactory_tools.versions.pf2024.types import TrfTapSide
+    from powerfactory_tools.versions.pf2024.types import TrfVectorGroup
+    from powerfactory_tools.versions.pf2024.types import TrfWindingVector
+    from powerfactory_tools.versions.pf2024.types import UnitSystem
+    from powerfactory_tools.versions.pf2024.types import VoltageSourceType
+    from powerfactory_tools.versions.pf2024.types import VoltageSystemType
+
+__all__ = [
+    "AcCurrentSource",
+    "AcVoltageSource",
+    "Application",
+    "BFuse",
+    "CommandBase",
+    "CommandFrequencySweep",
+    "CommandHarmonicCalculation",
+    "CommandLoadFlow",
+    "CommandResultExport",
+    "CommandSglLayout",
+    "CommandTimeSimulation",
+    "CommandTimeSimulationStart",
+    "CompoundModel",
+    "Coupler",
+    "DataDir",
+    "DataObject",
+    "Desktop",
+    "DeviceBase",
+    "DplScript",
+    "DslModel",
+    "EFuse",
+    "Element",
+    "Events",
+    "ExternalGrid",
+    "Fuse",
+    "FuseType",
+    "Generator",
+    "GeneratorBase",
+    "GeneratorControllerBase",
+    "Graph",
+    "Grid",
+    "GridDiagram",
+    "GridVariant",
+    "GridVariantStage",
+    "Line",
+    "LineBase",
+    "LineNType",
+    "LineType",
+    "Load",
+    "LoadBase",
+    "LoadBase3Ph",
+    "LoadFlowController",
+    "LoadLV",
+    "LoadLVP",
+    "LoadMV",
+    "LoadType",
+    "LoadTypeLV",
+    "LoadTypeMV",
+    "PVSystem",
+    "PowerFactoryExitError",
+    "PowerFactoryModule",
+    "Project",
+    "ProjectFolder",
+    "ProjectSettings",
+    "PythonScript",
+    "QPCharacteristic",
+    "Result",
+    "Scenario",
+    "Script",
+    "SecondaryController",
+    "Selection",
+    "Shunt",
+    "SourceBase",
+    "SourceTypeHarmonicCurrent",
+    "StationController",
+    "StationCubicle",
+    "StudyCase",
+    "Substation",
+    "SubstationField",
+    "Switch",
+    "SwitchType",
+    "Template",
+    "Terminal",
+    "Transformer2W",
+    "Transformer2WType",
+    "Transformer3W",
+    "Transformer3WType",
+    "TransformerBase",
+    "UnitConversionSetting",
+    "ValidPFPrimitive",
+    "ValidPFValue",
+    "VariableMonitor",
+]
+
+
+class DataObject(t.Protocol):
+    loc_name: str
+    fold_id: DataObject | None
+
+    def AddCopy(
+        self,
+        object_to_copy: DataObject | Sequence[DataObject],
+        concat_name_part: str | int = "",
+        /,
+    ) -> DataObject | None: ...
+
+    def CreateObject(
+        self,
+        class_name: str,
+        name: str | int | None,
+        /,
+    ) -> DataObject | None: ...
+
+    def CreateProject(
+        self,
+        projectName: str,
+        gridName: str,
+        parent: DataObject | None = None,  # None to use logged on user
+        /,
+    ) -> DataObject: ...
+
+    def CopyData(self, source: DataObject) -> int: ...
+
+    def Delete(self) -> int: ...
+
+    def GetAttributeDescription(
+        self,
+        name: str,
+        short: int = 0,  # 0: long description; 1: short description
+        /,
+    ) -> str | None: ...
+
+    def GetAttributeShape(
+        self,
+        name: str,
+        /,
+    ) -> tuple[int, int]:
+        """Returns the shape of an attribute.
+
+        Args:
+            name (str): Name of the attribute.
+
+        Returns:
+            tuple[int, int]: [number of rows, number of columns]
+                [>=0, >=0] Shape of a valid vector or matrix attribute.
+                [0, 0]     All other valid attributes.
+                [-1, 0]    For invalid attribute names.
+        """
+        ...
+
+    def GetAttributeType(
+        self,
+        name: str,
+        /,
+    ) -> AttributeType: ...
+
+    def GetAttributeUnit(
+        self,
+        name: str,
+        /,
+    ) -> str | None: ...
+
+    def GetChildren(
+        self,
+        hiddenMode: int,
+        filter: str = "*",  # noqa: A002
+        subfolders: int = 0,
+        /,
+    ) -> Sequence[DataObject]:
+        """This function returns the objects that are stored within the object the function was called on.
+
+        In contrast to DataObject.GetContents() this function gives access to objects that are currently hidden due to scheme management.
+
+        Args:
+            hiddenMode (int): Determines how hidden objects are handled.
+                0: Hidden objects are ignored. Only nonhidden objects are returned.
+                1: Hidden objects and nonhidden objects are returned.
+                2: Only hidden objects are returned. Nonhidden objects are ignored.
+            filter (str, optional): Name filter, possibly containing '*' and '?' characters.. Defaults to "*".
+            subfolders (int, optional): Determines if children of subfolders are returned. Defaults to 0.
+                0: Only direct children are returned, children of subfolders are ignored.
+                1: Also children of subfolders are returned.
+
+        Returns:
+            Sequence[DataObject]: Objects that are stored in the called object.
+        """
+        ...
+
+    def GetClassName(self) -> str: ...
+
+    def GetClassDescription(
+        self,
+        name: str,  # name of the class (see PFClassId)
+        /,
+    ) -> str: ...
+
+    def GetContents(
+        self,
+        name: str,
+        recursive: bool = False,  # noqa: FBT001, FBT002
+        /,
+    ) -> Sequence[DataObject]: ...
+
+    def GetFullName(
+        self,
+        type: int = 0,  # noqa: A002 # not given: no special formatting; 0: full name incl. path, >0: (but <=190) full name with specific lenght
+        /,
+    ) -> str: ...
+
+    def GetParent(self) -> DataObject | None: ...
+
+    def IsCalcRelevant(self) -> int: ...
+
+    def IsEarthed(self) -> int: ...
+
+    def IsEnergized(self) -> int: ...
+
+    def IsObjectActive(  # Check if an object is active for specific time.
+        self,
+        time: int,  # Time in seconds since 01.01.1970 00:00:00
+        /,
+    ) -> int: ...
+
+
+class DataDir(DataObject, t.Protocol): ...
+
+
+class Project(DataObject, t.Protocol):
+    pPrjSettings: ProjectSettings
+
+    def Deactivate(self) -> bool: ...
+
+
+class Scenario(DataObject, t.Protocol):  # PFClassId.SCENARIO
+    def Activate(self) -> bool: ...
+
+    def Deactivate(self) -> bool: ...
+
+
+class StudyCase(DataObject, t.Protocol):  # PFClassId.STUDY_CASE
+    iStudyTime: int
+
+    def Activate(self) -> bool: ...
+
+    def ApplyNetworkState(
+        self,
+        other: DataObject,  # the other study case to copy from: grids, scenarios and network variations configuration
+    ) -> t.Literal[0, 1, 2, 3, 4, 5]: ...
+
+    def ApplyStudyTime(
+        self,
+        other: DataObject,  # the other study case to copy from: study time
+    ) -> t.Literal[0, 1, 2, 3, 4]: ...
+
+    def Consolidate(self) -> bool: ...
+
+    def Deactivate(self) -> bool: ...
+
+    def SetStudyTime(
+        self,
+        date_time: int,  # Seconds since 01.01.1970 00:00:00.
+    ) -> None: ...
+
+
+class GridVariant(DataObject, t.Protocol):  # PFClassId.VARIANT
+    def Activate(self) -> bool: ...
+
+    def Deactivate(self) -> bool: ...
+
+    def NewStage(
+        self,
+        name: str,
+        activation_time: int,  # Activation time of the new expansion stage in seconds since 01.01.1970 00:00:00
+        activate: int,  # 1 - Activate (should be dafault); 0 - do not activate
+        /,
+    ) -> bool: ...
+
+
+class GridVariantStage(DataObject, t.Protocol):  # PFClassId.VARIANT_STAGE
+    tAcTime: str
+    iExclude: int
+
+    def Activate(self) -> bool: ...
+
+    def GetVariation(self) -> GridVariant: ...
+
+
+class ProjectSettings(DataObject, t.Protocol):  # PFClassId.PROJECT_SETTINGS
+    extDataDir: str
+    ilenunit: UnitSystem
+    clenexp: MetricPrefix  # Lengths
+    cspqexp: MetricPrefix  # Loads etc.
+    cspqexpgen: MetricPrefix  # Generators etc.
+    currency: Currency
+
+
+class UnitConversionSetting(DataObject, t.Protocol):
+    filtclass: Sequence[str]
+    filtvar: str
+    digunit: str
+    cdigexp: MetricPrefix
+    userunit: str
+    cuserexp: MetricPrefix
+    ufacA: float
+    ufacB: float
+
+
+class Grid(DataObject, t.Protocol):  # PFClassId.GRID
+    pDiagram: GridDiagram | None
+    frnom: float  # nominal frequency
+
+    def Activate(self) -> bool: ...
+
+    def Deactivate(self) -> bool: ...
+
+
+class GridDiagram(DataObject, t.Protocol):  # PFClassId.GRID_GRAPHIC
+    ...
+
+
+class Graph(DataObject, t.Protocol):
+    sSymName: str
+    pDataObj: DataObject | None
+    rCenterX: float
+    rCenterY: float
+    rSizeX: float
+    rSizeY: float
+    iRot: int
+    iLevel: int
+    iCol: int
+    iCollapsed: bool
+    iIndLS: int
+    iVis: bool
+
+
+class DslModel(DataObject, t.Protocol):  # PFClassId.DSL_MODEL
+    ...
+
+
+class Events(DataObject, t.Protocol): ...
+
+
+class Selection(DataObject, t.Protocol):  # PFClassId.SELECTION
+    iused: SelectionTarget
+    iusedSub: SelectionType
+
+    def AddRef(
+        self,
+        element: DataObject | list[DataObject],
+        /,
+    ) -> None: ...
+
+    def All(self) -> Sequence[DataObject]: ...
+
+    def GetAll(
+        self,
+        class_name: str,
+        /,
+    ) -> Sequence[DataObject]: ...
+
+    def AllElm(self) -> Sequence[Element]: ...
+
+    def Clear(self) -> None: ...
+
+
+class VariableMonitor(DataObject, t.Protocol):
+    obj_id: DataObject
+
+    def AddVar(
+        self,
+        var_name: str,
+        /,
+    ) -> None: ...
+
+    def AddVars(
+        self,
+        var_filter: str,  # e.g.: "e:*"
+        /,
+    ) -> None: ...
+
+    def ClearVars(self) -> None: ...
+
+    def GetVar(
+        self,
+        row: int,  # the row number of the attribute in the defined list of the variable monitor
+        /,
+    ) -> str:  # the variable name in line row
+        ...
+
+    def NVars(self) -> int:
+        """Returns the number of selected variables.
+
+        More exact, the number of lines in the variable selection text on the second page
+        of the IntMon dialogue, which usually contains one variable name per line.
+        """
+        ...
+
+    def RemoveVar(
+        self,
+        var_name: str,
+        /,
+    ) -> bool: ...
+
+    def PrintAllValues(self) -> None: ...
+
+    def PrintVal(self) -> None: ...
+
+
+class Result(DataObject, t.Protocol):  # PFClassId.RESULT
+    desc: Sequence[str]
+    calTp: CalculationType
+
+    def AddVariable(
+        self,
+        element: DataObject,
+        var_name: str,
+        /,
+    ) -> int: ...
+
+    def Clear(self) -> int:  # Always 0 and can be ignored
+        """Clears all data (calculation results) written to the result file.
+
+        The Variable definitions stored in the contents of ElmRes are not modified.
+        """
+        ...
+
+    def FindColumn(
+        self,
+        obj: DataObject,
+        var_name: str,
+        start_col: int,
+        /,
+    ) -> int: ...
+
+    def FinishWriting(self) -> None:
+        """Closes the result object after writing."""
+        ...
+
+    def Flush(self) -> int:
+        """This function is required in scripts which perform both file writing and reading operations.
+
+        All data must be written to the disk before attempting to read the file.
+        'Flush' copies all data buffered in memory to the disk.
+        After calling 'Flush'all data is available to be read from the file.
+        """
+
+    def GetNumberOfColumns(self) -> None: ...
+
+    def GetNumberOfRows(self) -> None: ...
+
+    def GetUnit(self, column: int, /) -> str: ...
+
+    def GetValue(
+        self,
+        row: int,
+        col: int,
+        /,
+    ) -> tuple[int, float]:  # first: error code; second: retrieved value
+        """Returns a value from a result object for row of curve col."""
+        ...
+
+    def GetVariable(self, column: int, /) -> str: ...
+
+    def InitialiseWriting(self) -> int:
+        """Opens the result object for writing."""
+        ...  # Always 0 and can be ignored
+
+    def Load(self) -> None:
+        """Loads the data of a result object (ElmRes) in memory for reading."""
+        ...
+
+    def Release(self) -> None:
+        """Releases the data loaded to memory."""
+        ...
+
+    def SetAsDefault(self) -> None:
+        """Sets this results object as the default results object.
+
+        Plots using the default result file will use this file for displaying data.
+        """
+        ...
+
+    def Write(
+        self,
+        default_value: float = float("nan"),  # optional default value
+        /,
+    ) -> int:
+        """Writes the current results (specified by VariableMonitor) to the result object."""
+        ...
+
+
+class Desktop(DataObject, t.Protocol):  # PFClassId.DESKTOP
+    def Close(self) -> bool: ...
+
+    def Freeze(self) -> bool: ...
+
+    def GetActivePage(self) -> DataObject: ...
+
+    def IsFrozen(self) -> bool: ...
+
+    def Unfreeze(self) -> bool: ...
+
+
+class CommandBase(DataObject, t.Protocol):
+    def Execute(self) -> int: ...
+
+
+class CommandLoadFlow(CommandBase, t.Protocol):  # CalculationCommand.LOAD_FLOW
+    iopt_net: NetworkExtendedCalcType
+    iPST_at: bool  # automatic step control of phase shifting transformers
+    iopt_plim: bool  # apply active power limits
+    iopt_at: bool  # automatic step control of transformers
+    iopt_asht: bool  # automatic step control of compensators/filters
+    iopt_lim: bool  # apply reactive power limits
+    iopt_tem: TemperatureDependencyType
+    temperature: float
+    iopt_pq: bool  # apply voltage dependecy of loads
+    iopt_fls: bool  # load scaling at defined feeders
+
+    i_power: int  # load flow method; 0 - NewtonRaphson (current eq.); 1 - Newton Raphson (power eq.)[default]
+
+    scLoadFac: float  # load scaling factor in percentage
+    scGenFac: float  # generator scaling factor in percentage
+    scMotFac: float  # motor scaling factor in percentage
+    zoneScale: int  # zone scaling; 0 - apply for all loads; 1 - apply only for scalable loads
+
+    def IsAC(self) -> int: ...
+
+    def IsDC(self) -> int: ...
+
+    def IsBalanced(self) -> int: ...
+
+
+class CommandHarmonicCalculation(CommandBase, t.Protocol):  # CalculationCommand.HARMONIC_LOADFLOW
+    iopt_sweep: int
+    iopt_allfrq: int
+    iopt_flicker: bool
+    iopt_SkV: bool
+    iopt_pseq: bool
+    iopt_net: NetworkCalcType
+    frnom: float
+    fshow: float
+    ifshow: float
+    p_resvar: Result
+
+    errmax: float
+    errinc: float
+    ninc: float
+    iopt_thd: int
+
+
+class CommandFrequencySweep(CommandBase, t.Protocol):  # CalculationCommand.FREQUENCY_SWEEP
+    iopt_net: NetworkCalcType
+    ildfinit: bool  # load flow initialisation
+    fstart: float
+    fstep: float
+    fstop: float
+    i_adapt: bool  # automatic step size adaption
+
+
+class CommandSglLayout(CommandBase, t.Protocol):  # CalculationCommand.GRAPHIC_LAYOUT_TOOL
+    iAction: int
+    orthoType: int
+    insertionMode: int
+    nodeDispersion: int
+    neighborhoodSize: int
+    neighborStartElems: Selection
+
+
+class CommandTimeSimulationStart(CommandBase, t.Protocol):  # CalculationCommand.TIME_DOMAIN_SIMULATION_START
+    iopt_sim: TimeSimulationType
+    iopt_net: TimeSimulationNetworkCalcType
+    iopt_show: int
+    iopt_adapt: int  # automatic step size adaption
+    iReuseLdf: int  # re-use load flow results
+    p_event: Events  # collection of events to be used
+    p_resvar: Result  # result object to be used for savings
+    c_butldf: CommandLoadFlow  # related load flow object if used
+
+    dtgrd: float  # step size electro-mechanical
+    dtemt: float  # step size electro-magnetic
+    tstart: float  # start time related to 0 seconds
+
+
+class CommandTimeSimulation(CommandBase, t.Protocol):  # CalculationCommand.TIME_DOMAIN_SIMULATION
+    tstop: float  # final simulation time
+    cominc: CommandTimeSimulationStart
+
+    def GetSimulationTime(self) -> int: ...
+
+
+class CommandResultExport(CommandBase, t.Protocol):  # CalculationCommand.RESULT_EXPORT
+    f_name: str  # only for specific ResultExportMode (2, 3, 4, 5, 6)
+    ciopt_head: ResultExportColumnHeadingVariable
+    col_Sep: str  # for csv: colunm separator
+    dec_Sep: str  # for csv: decimal separator
+    filtered: ResultExportIntervalFilter
+    # from: float  # only when using specific interval: start time in seconds
+    iopt_csel: ResultExportVariableSelection
+    iopt_exp: ResultExportMode
+    iopt_locn: ResultExportColumnHeadingElement
+    iopt_rscl: bool  # move time scale
+    iopt_sep: bool  # True if system separator should be used
+    iopt_tsel: bool  # use specific interval
+    iopt_vars: t.Literal[0, 1, 2]
+    nsteps: int  # only when filtered is not 0
+    numberFormat: ResultExportNumberFormat
+    numberPrecisionFixed: int  # number of digits after decimal point
+    pResult: Result
+    scl_start: float  # only when iopt_rscl is True: new start time in seconds
+    to: float  # only when using specific interval: end time in seconds
+
+    def ExportFullRange(self) -> None: ...
+
+
+class Script(t.Protocol):
+    def SetExternalObject(
+        self,
+        name: str,
+        value: DataObject,
+        /,
+    ) -> int: ...
+
+    def Execute(self) -> int: ...
+
+
+class DplScript(Script, t.Protocol):  # PFClassId.SCRIPT_DPL
+    ...
+
+
+class PythonScript(Script, t.Protocol):  # PFClassId.SCRIPT_PYTHON
+    ...
+
+
+class ProjectFolder(DataObject, t.Protocol):  # PFClassId.FOLDER
+    desc: Sequence[str]
+    iopt_typ: FolderType
+
+    def GetProjectFolderType(self) -> str: ...
+
+    def IsProjectFolderType(self, folder_type: str) -> int: ...
+
+
+class Application(t.Protocol):
+    def ActivateProject(self, name: str) -> int: ...
+
+    def EchoOff(self) -> None: ...
+
+    def EchoOn(self) -> None: ...
+
+    def ExecuteCmd(
+        self,
+        command: str,
+        /,
+    ) -> None: ...
+
+    def GetActiveProject(self) -> Project | None: ...
+
+    def GetActiveScenario(self) -> Scenario | None: ...
+
+    def GetActiveStages(
+        self,
+        varied_folder: DataObject,
+        /,
+    ) -> Sequence[GridVariantStage]: ...
+
+    def GetActiveNetworkVariations(self) -> Sequence[GridVariant]: ...
+
+    def GetActiveStudyCase(self) -> StudyCase | None: ...
+
+    def GetAttributeUnit(
+        self,
+        class_name: str,
+        attribute_name: str,
+        /,
+    ) -> str: ...
+
+    def GetBorderCubicles(
+        self,
+        element: Element,  # element from which the search for border cubicles starts
+        /,
+    ) -> Sequence[StationCubicle]: ...
+
+    def GetCalcRelevantObjects(
+        self,
+        name_filter: str,
+        include_out_of_service: int,
+        topo_elements_only: int = 0,
+        b_ac_schemes: int = 0,
+        /,
+    ) -> Sequence[DataObject]: ...
+
+    def GetCurrentScript(self) -> Script | None: ...
+
+    def GetProjectFolder(
+        self,
+        name: str,
+        /,
+    ) -> DataObject: ...
+
+    def GetFromStudyCase(
+        self,
+        class_name: str,
+        /,
+    ) -> DataObject:
+        """Returns the first found object of class “className” from the currently active study case.
+
+        The object is created when no object of the given name and/or class was found.
+        For commands the returned instance corresponds to the one that is used if opened via the main
+        menue load-flow, short-circuit, transient simulation, etc.
+        """
+        ...
+
+    def Hide(self) -> None:
+        """Hides the PowerFactory application window."""
+        ...
+
+    def PostCommand(
+        self,
+        command: t.Literal["exit"],
+        /,
+    ) -> None: ...
+
+    def ResetCalculation(self) -> None: ...
+
+    def SetGuiUpdateEnabled(self, enabled: int) -> bool: ...
+
+    def Show(self) -> None:
+        """Shows the PowerFactory application window. Not for engine-only licenses."""
+        ...
+
+
+class PowerFactoryExitError(Exception):
+    code: int
+    args: tuple[t.Any, ...]
+
+
+class PowerFactoryModule(Protocol):
+    ExitError: tuple[type[PowerFactoryExitError], ...]
+
+    def GetApplicationExt(
+        self,
+        username: str | None = None,
+        password: str | None = None,
+        command_line_arguments: str | None = None,
+        /,
+    ) -> Application: ...
+
+
+## Physical Elements
+
+
+class Element(DataObject, t.Protocol):
+    desc: Sequence[str]
+
+
+class DeviceBase(Element, t.Protocol):
+    pf_recap: PFRecap
+    outserv: bool
+
+
+class Substation(DataObject, t.Protocol): ...  # PFClassId.SUBSTATION
+
+
+class SubstationField(DataObject, t.Protocol):  # PFClassId.SUBSTATION_FIELD
+    cpBusbar: Terminal | None  # one of the busbars in the substation where this field is connected to
+    cpConBranch: Line | None  # connected branch from outside of substation
+    swtstate: bool  # switching state
+    Inom: float
+
+
+class LoadType(DataObject, t.Protocol):  # PFClassId.LOAD_TYPE_GENERAL
+    loddy: float  # portion of dynamic part of ZIP load model in RMS simulation (100 = 100% dynamic)
+    systp: VoltageSystemType
+    phtech: LoadPhaseConnectionType
+
+    aP: float  # a-portion of the active power in relation to ZIP load model
+    bP: float  # b-portion of the active power in relation to ZIP load model
+    cP: float  # c-portion of the active power in relation to ZIP load model
+    kpu0: float  # exponent of the a-portion of the active power in relation to ZIP load model
+    kpu1: float  # exponent of the b-portion of the active power in relation to ZIP load model
+    kpu: float  # exponent of the c-portion of the active power in relation to ZIP load model
+
+    aQ: float  # a-portion of the reactive power in relation to ZIP load model
+    bQ: float  # b-portion of the reactive power in relation to ZIP load model
+    cQ: float  # c-portion of the reactive power in relation to ZIP load model
+    kqu0: float  # exponent of the a-portion of the reactive power in relation to ZIP load model
+    kqu1: float  # exponent of the b-portion of the reactive power in relation to ZIP load model
+    kqu: float  # exponent of the c-portion of the reactive power in relation to ZIP load model
+
+    i_crsc: HarmonicLoadModelType
+    i_pure: int  # for harmonic load model type IMPEDANCE_TYPE_1; 0 - pure inductive/capacitive; 1 - mixed inductive/capacitive
+    Prp: float  # for harmonic load model type IMPEDANCE_TYPE_2; static portion in percent
+    pcf: float  # for harmonic load model type IMPEDANCE_TYPE_2; load factor correction in percent
+
+
+class SourceTypeHarmonicCurrent(DataObject, t.Protocol):  # PFClassId.SOURCE_TYPE_HARMONIC_CURRENT
+    i_usym: HarmonicSourceSystemType
+
+
+class LineType(DataObject, t.Protocol):  # PFClassId.LINE_TYPE
+    uline: float  # rated voltage (kV)
+    sline: float  # rated current (kA) when installed in soil
+    InomAir: float  # rated current (kA) when installed in air
+    rline: float  # resistance (Ohm/km) positive sequence components
+    rline0: float  # resistance (Ohm/km) zero sequence components
+    xline: float  # reactance (Ohm/km) positive sequence components
+    xline0: float  # reactance (Ohm/km) zero sequence components
+    gline: float  # conductance (µS/km) positive sequence components
+    gline0: float  # conductance (µS/km) zero sequence components
+    bline: float  # susceptance (µS/km) positive sequence components
+    bline0: float  # susceptance (µS/km) zero sequence components
+
+    nlnph: float  # no. of phase conducters
+    nneutral: float  # no. of neutral conductors
+
+    systp: VoltageSystemType
+    frnom: float  # nominal frequency the values x and b apply
+
+
+class LineNType(LineType, t.Protocol):
+    rnline: float  # resistance (Ohm/km) natural neutral components
+    rpnline: float  # resistance (Ohm/km) natural neutral-line couple components
+    xnline: float  # reactance (Ohm/km) natural neutral components
+    xpnline: float  # reactance (Ohm/km) natural neutral-line couple components
+    gnline: float  # conductance (µS/km) natural neutral components
+    gpnline: float  # conductance (µS/km) natural neutral-line couple components
+    bnline: float  # susceptance (µS/km) natural neutral components
+    bpnline: float  # susceptance (µS/km) natural neutral-line couple components
+
+
+class Transformer2WType(DataObject, t.Protocol):  # PFClassId.TRANSFORMER_2W_TYPE
+    utrn_l: float  # reference voltage LV side
+    utrn_h: float  # reference voltage HV side
+    pfe: float  # Iron losses
+    curmg: float  # no-load current
+    pcutr: float  # Cupper losses
+    strn: float  # rated power
+    uktr: float  # short-circuit voltage in percentage (pos. seq.)
+    uk0tr: float  # short-circuit voltage in percentage (zero. seq.)
+    ur0tr: float  # real part of uk0tr
+    r1pu: float
+    r0pu: float
+    x1pu: float
+    x0pu: float
+    zx0hl_n: float  # Zero Sequence Magnetising Impedance: Mag. Impedance / uk0
+    rtox0_n: float  # Zero Sequence Magnetising R/X ratio: Mag. R/X
+    itrdr: float  # Distribution of Leakage Resistances (p.u.): r, Pos.Seq. HV-Side
+    itrdr_lv: float  # Distribution of Leakage Resistances (p.u.): r, Pos.Seq. LV-Side
+    itrdl: float  # Distribution of Leakage Reactances (p.u.): x, Pos.Seq. HV-Side
+    itrdl_lv: float  # Distribution of Leakage Reactances (p.u.): x, Pos.Seq. LV-Side
+    zx0hl_h: float  # Distribution of Zero Sequ. Leakage-Impedances: z, Zero Seq. HV-Side
+    zx0hl_l: float  # Distribution of Zero Sequ. Leakage-Impedances: z, Zero Seq. LV-Side
+    x0tor0: float  # Zero Sequence Impedance: Ratio X0/R0
+
+    vecgrp: TrfVectorGroup
+    tr2cn_l: TrfWindingVector  # vector at LV side
+    tr2cn_h: TrfWindingVector  # vector at HV side
+    nt2ag: float
+
+    tap_side: TrfTapSide
+    ntpmn: int
+    ntpmx: int
+    nntap0: int
+    dutap: float
+    phitr: float
+    itapch: int
+    itapch2: int
+
+    nt2ph: TrfPhaseTechnology
+
+
+class Transformer3WType(DataObject, t.Protocol):  # PFClassId.TRANSFORMER_3W_TYPE
+    ...
+
+
+class Shunt(Element, t.Protocol):  # PFClassId.SHUNT
+    bus1: StationCubicle | None
+    systp: VoltageSystemType
+    ctech: ShuntPhaseConnectionType
+    shtype: ShuntType
+    bcap: float  # suszeptance of a single block
+    c1: float  # capacitance C1 of a single block; for R-L-C1-C2-Rp type
+    c2: float  # capacitance C1 of a single block; for R-L-C1-C2-Rp type
+    xrea: float  # reactance of a single block
+    rrea: float  # resistance of a single block
+    rpara: float  # parallel resistance of a single block
+    gparac: float  # parallel conductance of a single block; for C tpye
+
+    iintgnd: ShuntNeutralConnectionType  # neutral connection
+    Bg: float  # susceptance against earth
+    cgnd: NeutralPointEarthing
+    Re: float  # resistance from internal star/neutral point against earth
+    Xe: float  # reactance from internal star/neutral point against earth
+    iZeConfig: bool  # 0: Re and Xe related to single block; 1: Re and Xe related to whole shunt
+    R0toR1: float  # ratio of zero sequence resistance to positive sequence resistance
+    X0toX1: float  # ratio of zero sequence reactance to positive sequence reactance
+
+    ncapx: int  # number of single blocks in a row
+    ncapa: int  # amount of actual seclected blocks
+    c_pctrl: DataObject | None
+
+
+class SwitchType(DataObject, t.Protocol):  # PFClassId.SWITCH
+    Inom: float
+    R_on: float
+    X_on: float
+
+
+class Coupler(DataObject, t.Protocol):  # PFClassId.COUPLER
+    bus1: StationCubicle | None
+    bus2: StationCubicle | None
+    typ_id: SwitchType | None
+    cpSubstat: Substation | None
+    isclosed: bool
+    desc: Sequence[str]
+
+
+class LineBase(DataObject, t.Protocol):
+    cDisplayName: str
+    desc: Sequence[str]
+    outserv: bool
+
+
+class Terminal(DataObject, t.Protocol):  # PFClassId.TERMINAL
+    cDisplayName: str
+    ciEnergized: bool
+    desc: Sequence[str]
+    uknom: float
+    iUsage: NodeType
+    outserv: bool
+    cStatName: str
+    cpSubstat: Substation | None
+    cubics: Sequence[StationCubicle]
+    systype: TerminalVoltageSystemType
+    phtech: TerminalPhaseConnectionType
+
+    def GetCalcRelevantCubicles(self) -> Sequence[StationCubicle]: ...
+
+    def GetConnectedMainBuses(
+        self,
+        consider_switches: bool = True,  # noqa: FBT001, FBT002
+    ) -> Sequence[StationCubicle]: ...
+
+    def GetEquivalentTerminals(self) -> Sequence[Terminal]:
+        # Euqivalent means that those terminals are topologically connected only by
+        # - closed switching devices (ElmCoup, RelFuse) or
+        # - lines of zero length (line droppers).
+        # Returns all terminals that are equivalent to current one. Current one is also included so the set is never empty.
+        ...
+
+    def IsInternalNodeInStation(self) -> bool: ...
+
+
+class StationCubicle(DataObject, t.Protocol):  # PFClassId.CUBICLE
+    cterm: Terminal
+    obj_id: Line | Element | None
+    nphase: int
+    cPhInfo: str
+
+
+class TransformerBase(LineBase, t.Protocol):
+    buslv: StationCubicle | None
+    bushv: StationCubicle | None
+
+
+class Transformer2W(TransformerBase, t.Protocol):  # PFClassId.TRANSFORMER_2W
+    ntnum: int
+    typ_id: Transformer2WType | None
+    nntap: int
+
+    cneutcon: TrfNeutralConnectionType
+    cgnd_h: NeutralPointEarthing
+    cgnd_l: NeutralPointEarthing
+    cpeter_h: bool
+    cpeter_l: bool
+    re0tr_h: float
+    re0tr_l: float
+    xe0tr_h: float
+    xe0tr_l: float
+
+
+class Transformer3W(TransformerBase, t.Protocol):  # PFClassId.TRANSFORMER_3W
+    busmv: StationCubicle | None
+    nt3nm: int
+    typ_id: Transformer3WType | None
+    n3tapl: int
+    n3tapm: int
+    n3taph: int
+
+
+class GeneratorControllerBase(DataObject, t.Protocol):
+    c_pmod: CompoundModel | None
+
+
+class SecondaryController(GeneratorControllerBase, t.Protocol): ...
+
+
+class StationController(GeneratorControllerBase, t.Protocol):  # PFClassId.STATION_CONTROLLER
+    i_ctrl: ExternalQCtrlMode
+    qu_char: QChar
+    qsetp: float
+    iQorient: QOrient
+    refbar: Terminal
+    Srated: float
+    ddroop: float
+    Qmin: float
+    Qmax: float
+    udeadblow: float
+    udeadbup: float
+    cosphi_char: CosPhiChar
+    pfsetp: float
+    pf_recap: PFRecap
+    tansetp: float
+    usetp: float
+    pQPcurve: QPCharacteristic  # Q(P)-characteristic curve
+    p_cub: StationCubicle  # cubicle where power is measured for the controlled generator
+    u_under: float
+    u_over: float
+    pf_under: float
+    pf_over: float
+    p_under: float
+    p_over: float
+    i_phase: CtrlVoltageRef
+
+
+class LoadFlowController(Element, t.Protocol):  # PFClassId.LOAD_FLOW_CONTROLLER
+    outserv: bool
+    i_ctrl: LoadFlowCtrlMode
+
+    usetp: float  # voltage magnitude setpoint in p.u.
+    phiusetp: float  # voltage angle setpoint in deg
+    p_bar: Terminal  # controlled terminal
+
+    Psetp: float  # active power setpoint in MW
+    Qsetp: float  # reactive power setpoint in Mvar
+    p_cub: StationCubicle  # controlled cubicle
+
+
+class GeneratorBase(DeviceBase, t.Protocol):
+    bus1: StationCubicle | None
+    scale0: float
+
+    ngnum: int
+    sgn: float
+    cosn: float
+    pgini: float
+    qgini: float
+    cosgini: float
+    Kpf: float
+    ddroop: float
+    Qfu_min: float
+    Qfu_max: float
+    udeadblow: float
+    udeadbup: float
+    av_mode: LocalQCtrlMode
+    mode_inp: ModeInpGen
+    sgini_a: float
+    pgini_a: float
+    qgini_a: float
+    cosgini_a: float
+    pf_recap_a: PFRecap
+    scale0_a: float
+    c_pstac: StationController | None
+    c_pmod: CompoundModel | None  # Compound Parent Model/Template
+    pQPcurve: QPCharacteristic | None  # Q(P)-characteristic curve
+    pf_under: float
+    pf_over: float
+    p_under: float
+    p_over: float
+    usetp: float
+    phtech: GeneratorPhaseConnectionType
+
+
+class QPCharacteristic(DataObject, t.Protocol):
+    inputmod: bool
+
+
+class Generator(GeneratorBase, t.Protocol):  # PFClassId.GENERATOR
+    aCategory: GeneratorSystemType
+    c_psecc: SecondaryController | None
+
+
+class PVSystem(GeneratorBase, t.Protocol):  # PFClassId.PVSYSTEM
+    uk: float
+    Pcu: float
+
+
+class LoadBase(DeviceBase, t.Protocol):
+    typ_id: LoadType | LoadTypeLV | LoadTypeMV | None
+
+
+class LoadBase3Ph(LoadBase, t.Protocol):
+    bus1: StationCubicle | None
+    scale0: float
+
+    slini: float
+    slinir: float
+    slinis: float
+    slinit: float
+    plini: float
+    plinir: float
+    plinis: float
+    plinit: float
+    qlini: float
+    qlinir: float
+    qlinis: float
+    qlinit: float
+    ilini: float
+    ilinir: float
+    ilinis: float
+    ilinit: float
+    coslini: float
+    coslinir: float
+    coslinis: float
+    coslinit: float
+
+
+class Load(LoadBase3Ph, t.Protocol):  # PFClassId.LOAD
+    typ_id: LoadType | None
+    mode_inp: ModeInpLoad
+    i_sym: ISym
+    u0: float
+    phtech: LoadPhaseConnectionType
+
+
+class Switch(DataObject, t.Protocol):  # PFClassId.SWITCH
+    fold_id: StationCubicle
+    isclosed: bool  # 0:open; 1:closed
+
+
+class Line(LineBase, t.Protocol):  # PFClassId.LINE
+    bus1: StationCubicle | None
+    bus2: StationCubicle | None
+    nlnum: int  # no. of parallel lines
+    dline: float  # line length (km)
+    fline: float  # installation factor
+    inAir: bool  # 0:soil; 1:air
+    Inom_a: float  # nominal current (actual)
+    typ_id: LineType | None
+
+
+class FuseType(DataObject, t.Protocol):  # PFClassId.FUSE_TYPE
+    urat: float  # rated voltage
+    irat: float  # rated current
+    frq: float  # nominal frequency
+    itype: FuseCharacteristicType
+
+
+class Fuse(DataObject, t.Protocol):  # PFClassId.FUSE
+    desc: Sequence[str]
+    typ_id: FuseType | None
+    on_off: bool  # closed = 1; open = 0
+    outserv: bool
+    bus1: StationCubicle | None
+    bus2: StationCubicle | None
+
+
+class BFuse(Fuse, t.Protocol): ...
+
+
+class EFuse(Fuse, t.Protocol):
+    fold_id: StationCubicle
+    cn_bus: Terminal
+    cbranch: LineBase | Element | Fuse
+    bus1: None
+    bus2: None
+
+
+class ExternalGrid(DataObject, t.Protocol):  # PFClassId.EXTERNAL_GRID
+    bustp: BusType
+    bus1: StationCubicle | None
+    desc: Sequence[str]
+    usetp: float  # in p.u.
+    pgini: float  # in MW
+    qgini: float  # in Mvar
+    phiini: float  # in deg
+    snss: float  # in MVA
+    snssmin: float  # in MVA
+    outserv: bool
+
+
+class SourceBase(DataObject, t.Protocol):
+    bus1: StationCubicle | None
+    outserv: bool
+    nphase: int
+    desc: Sequence[str]
+    c_pmod: CompoundModel | None  # Compound Parent Model/Template
+
+
+class AcCurrentSource(SourceBase, t.Protocol):  # PFClassId.CURRENT_SOURCE_AC
+    Ir: float
+
+    isetp: float
+    cosini: float
+    i_cap: PFRecap
+    G1: float
+    B1: float
+    isetp2: float
+    phisetp2: float
+    G2: float
+    B2: float
+    isetp0: float
+    phisetp0: float
+    G0: float
+    B0: float
+    phmc: SourceTypeHarmonicCurrent | None
+
+
+class AcVoltageSource(SourceBase, t.Protocol):  # PFClassId.VOLTAGE_SOURCE_AC
+    Unom: float
+    itype: VoltageSourceType
+
+    usetp: float  # positive sequence voltage magniutde in p.u.
+    phisetp: float  # positive sequence voltage angle in p.u.
+    contbar: Terminal | None  # controlled terminal
+    R1: float  # positive sequence resistance in Ohm
+    X1: float  # positive sequence reactance in Ohm
+    p_uctrl: LoadFlowController | None
+    p_phictrl: LoadFlowController | None
+
+    usetp0: float  # zero sequence voltage magniutde in p.u.
+    phisetp0: float  # zero sequence voltage angle in p.u.
+    R0: float  # zero sequence resistance in Ohm
+    X0: float  # zero sequence reactance in Ohm
+    usetp2: float  # negative sequence voltage magniutde in p.u.
+    phisetp2: float  # negative sequence voltage angle in p.u.
+    R2: float  # negative sequence resistance in Ohm
+    X2: float  # negative sequence reactance in Ohm
+
+
+class Template(DataObject, t.Protocol):  # PFClassId.TEMPLATE
+    ...
+
+
+class CompoundModel(DataObject, t.Protocol):  # PFClassId.COMPOUND_MODEL
+    ...
+
+
+## The following may be part of version inconsistent behavior
+
+
+class LoadTypeLV(DataObject, t.Protocol):  # PFClassId.LOAD_TYPE_LV
+    # voltage dependency of load
+    iLodTyp: PowerModelType  # composite (ZIP) / exponent
+    aP: float  # const. power part of the active power in relation to ZIP load model
+    bP: float  # const. current part of the active power in relation to ZIP load model
+    cP: float  # const. impedance part of the active power in relation to ZIP load model
+    aQ: float  # const. power part of the reactive power in relation to ZIP load model
+    bQ: float  # const. current part of the reactive power in relation to ZIP load model
+    cQ: float  # const. impedance part of the reactive power in relation to ZIP load model
+    eP: float  # exponent of the active power in relation to exponential load model
+    eQ: float  # exponent of the reactive power in relation to exponential load model
+
+    # addtional load characteristics for single customer (flexible load)
+    Smax: float  # maximum apparent power for a single residential unit, per default in kVA
+    cosphi: float  # power factor
+    ginf: float  # simultaneity factor
+
+
+# LoadTypeMV is an equivalent of a distribution transformer
+class LoadTypeMV(DataObject, t.Protocol):  # PFClassId.LOAD_TYPE_MV
+    strn: float  # rated power, per default in MVA
+    frnom: float  # nominal frequency
+    tratio: float  # transformer ratio
+    phtech: LoadPhaseConnectionType
+
+    uktr: float  # short-circuit voltage in percentage (pos. seq.)
+    pcutr: float  # cupper losses, per default in kW
+
+    iZzero: bool  # 1 zero seq. impedance is given; 0 zero seq. impedance is not given
+    uk0tr: float  # short-circuit voltage in percentage (zero. seq.)
+    ur0tr: float  # real part of uk0tr
+
+    pfe: float  # iron losses, per default in kW
+    dutap: float  # additional voltage per tap changer step in percentage
+    nntap0: int  # neutral position of tap changer
+    ntpmn: int  # lowest position of tap changer
+    ntpmx: int  # highest position of tap changer
+
+    # voltage dependency of load
+    LodTyp: PowerModelType  # composite (ZIP) / exponent
+    aP: float  # const. power part of the active power in relation to ZIP load model
+    bP: float  # const. current part of the active power in relation to ZIP load model
+    cP: float  # const. impedance part of the active power in relation to ZIP load model
+    aQ: float  # const. power part of the reactive power in relation to ZIP load model
+    bQ: float  # const. current part of the reactive power in relation to ZIP load model
+    cQ: float  # const. impedance part of the reactive power in relation to ZIP load model
+    eP: float  # exponent of the active power in relation to exponential load model
+    eQ: float  # exponent of the reactive power in relation to exponential load model
+
+
+class LoadLVP(LoadBase, t.Protocol):  # PFClassId.LOAD_LV_PART
+    typ_id: LoadTypeLV | None
+    phtech: LoadLVPhaseConnectionType
+    NrCust: int  # number of customers
+
+    # Fixed customer load
+    iopt_inp: IOpt
+    elini: float
+    cplinia: float
+    slini: float
+    plini: float
+    qlini: float
+    ilini: float
+    coslini: float
+    ulini: float
+
+    # Nigth storage heating
+    pnight: float
+
+    # Flexible customer load
+    cSav: float
+    cSmax: float
+    ccosphi: float
+
+
+class LoadLV(LoadBase3Ph, LoadLVP, t.Protocol):  # PFClassId.LOAD_LV
+    typ_id: LoadTypeLV | None
+    phtech: LoadLVPhaseConnectionType
+    classif: int  # classification of load
+
+    i_sym: ISym  # symmetry of load. 0: symmetrical; 1: asymmetrical
+    lodparts: Sequence[LoadLVP]
+
+
+class LoadMV(LoadBase3Ph, t.Protocol):  # PFClassId.LOAD_MV
+    typ_id: LoadTypeMV | None
+    mode_inp: ModeInpMV
+    ci_sym: ISym
+    elini: float
+    cplinia: float
+    sgini: float
+    sginir: float
+    sginis: float
+    sginit: float
+    pgini: float
+    pginir: float
+    pginis: float
+    pginit: float
+    cosgini: float
+    cosginir: float
+    cosginis: float
+    cosginit: float
+    gscale: float
+    pfg_recap: PFRecap
+    phtech: LoadPhaseConnectionType
+
+
+ValidPFPrimitive = DataObject | str | bool | int | float | None
+ValidPFValue = ValidPFPrimitive | list[ValidPFPrimitive] | dict[str, ValidPFPrimitive]
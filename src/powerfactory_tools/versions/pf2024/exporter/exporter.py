@@ -35,7 +35,6 @@ from psdm.quantities.single_phase import Length
 from psdm.quantities.single_phase import PhaseAngleClock
 from psdm.steadystate_case.active_power import ActivePower as ActivePowerSSC
 from psdm.steadystate_case.case import Case as SteadystateCase
-from psdm.steadystate_case.characteristic import Characteristic
 from psdm.steadystate_case.controller import ControlledVoltageRef
 from psdm.steadystate_case.controller import ControlQP
 from psdm.steadystate_case.controller import PController
@@ -106,6 +105,7 @@ from powerfactory_tools.versions.pf2024.types import TrfTapSide
 from powerfactory_tools.versions.pf2024.types import TrfVectorGroup
 from powerfactory_tools.versions.pf2024.types import TrfWindingVector
 from powerfactory_tools.versions.pf2024.types import VoltageSystemType as ElementVoltageSystemType
+from powerfactory_tools.versions.pf2024.types import from_value
 
 if t.TYPE_CHECKING:
     from types import TracebackType
@@ -125,6 +125,11 @@ STRING_SUBCONSUMER_START = "subconsumer_follows" + STRING_SEPARATOR
 PF_LOAD_CLASSES = [PFClassId.LOAD, PFClassId.LOAD_LV, PFClassId.LOAD_LV_PART, PFClassId.LOAD_MV]
 STORAGE_SYSTEM_TYPES = [SystemType.BATTERY_STORAGE, SystemType.PUMP_STORAGE]
 
+# Lookup tables from raw PowerFactory codes to the matching psdm enum members
+PF_VECTOR_GROUPS = {vg.value: TVectorGroup[vg.name] for vg in TrfVectorGroup if vg.name in TVectorGroup.__members__}
+PF_WINDING_VECTOR_GROUPS = {wv.value: WVectorGroup[wv.name] for wv in TrfWindingVector}
+PF_GENERATOR_SYSTEM_TYPES = {st.value: SystemType[st.name] for st in GeneratorSystemType}
+
 
 @pydantic.dataclasses.dataclass
 class LoadLVPower:
@@ -541,7 +546,7 @@ class PowerFactoryExporter:
             return None
 
         node_name = self.pfi.create_name(ext_grid.bus1.cterm, grid_name=grid_name)
-        phase_connection_type = TerminalPhaseConnectionType(ext_grid.bus1.cterm.phtech)
+        phase_connection_type = from_value(TerminalPhaseConnectionType, ext_grid.bus1.cterm.phtech)
         phases = self.get_external_grid_phases(
             phase_connection_type=phase_connection_type,  # default
             bus=ext_grid.bus1,
@@ -592,7 +597,7 @@ class PowerFactoryExporter:
                 "substation internal" if not description else "substation internal" + STRING_SEPARATOR + description
             )
 
-        phases = self.get_terminal_phases(TerminalPhaseConnectionType(terminal.phtech))
+        phases = self.get_terminal_phases(from_value(TerminalPhaseConnectionType, terminal.phtech))
 
         extra_meta_data = self.get_extra_element_attrs(terminal, self.element_specific_attrs, grid_name=grid_name)
 
@@ -691,17 +696,17 @@ class PowerFactoryExporter:
             bpn = None
 
         f_nom = l_type.frnom  # usually 50 Hertz
-        u_system_type = VoltageSystemType[ElementVoltageSystemType(l_type.systp).name]
+        u_system_type = VoltageSystemType[from_value(ElementVoltageSystemType, l_type.systp).name]
 
         phases_1 = self.get_branch_phases(
             l_type=l_type,
-            phase_connection_type=TerminalPhaseConnectionType(t1.phtech),
+            phase_connection_type=from_value(TerminalPhaseConnectionType, t1.phtech),
             bus=line.bus1,
             grid_name=grid_name,
         )
         phases_2 = self.get_branch_phases(
             l_type=l_type,
-            phase_connection_type=TerminalPhaseConnectionType(t2.phtech),
+            phase_connection_type=from_value(TerminalPhaseConnectionType, t2.phtech),
             bus=line.bus2,
             grid_name=grid_name,
         )
@@ -806,10 +811,10 @@ class PowerFactoryExporter:
         t1_name = self.pfi.create_name(t1, grid_name=grid_name)
         t2_name = self.pfi.create_name(t2, grid_name=grid_name)
 
-        voltage_system_type = VoltageSystemType[TerminalVoltageSystemType(t1.systype).name]
+        voltage_system_type = VoltageSystemType[from_value(TerminalVoltageSystemType, t1.systype).name]
 
-        phases_1 = self.get_terminal_phases(phase_connection_type=TerminalPhaseConnectionType(t1.phtech))
-        phases_2 = self.get_terminal_phases(phase_connection_type=TerminalPhaseConnectionType(t2.phtech))
+        phases_1 = self.get_terminal_phases(phase_connection_type=from_value(TerminalPhaseConnectionType, t1.phtech))
+        phases_2 = self.get_terminal_phases(phase_connection_type=from_value(TerminalPhaseConnectionType, t2.phtech))
 
         extra_meta_data = self.get_extra_element_attrs(coupler, self.element_specific_attrs, grid_name=grid_name)
 
@@ -889,10 +894,10 @@ class PowerFactoryExporter:
         t1_name = self.pfi.create_name(t1, grid_name=grid_name)
         t2_name = self.pfi.create_name(t2, grid_name=grid_name)
 
-        voltage_system_type = VoltageSystemType[TerminalVoltageSystemType(t1.systype).name]
+        voltage_system_type = VoltageSystemType[from_value(TerminalVoltageSystemType, t1.systype).name]
 
-        phases_1 = self.get_terminal_phases(phase_connection_type=TerminalPhaseConnectionType(t1.phtech))
-        phases_2 = self.get_terminal_phases(phase_connection_type=TerminalPhaseConnectionType(t2.phtech))
+        phases_1 = self.get_terminal_phases(phase_connection_type=from_value(TerminalPhaseConnectionType, t1.phtech))
+        phases_2 = self.get_terminal_phases(phase_connection_type=from_value(TerminalPhaseConnectionType, t2.phtech))
 
         extra_meta_data = self.get_extra_element_attrs(fuse, self.element_specific_attrs, grid_name=grid_name)
 
@@ -1020,7 +1025,7 @@ class PowerFactoryExporter:
         if t_type is not None:
             t_number = transformer_2w.ntnum
 
-            ph_technology = TransformerPhaseTechnologyType[TrfPhaseTechnology(t_type.nt2ph).name]
+            ph_technology = TransformerPhaseTechnologyType[from_value(TrfPhaseTechnology, t_type.nt2ph).name]
 
             # Rated Voltage of the transformer_2w windings itself (CIM: ratedU)
             u_ref_h = t_type.utrn_h * Exponents.VOLTAGE  # V
@@ -1041,14 +1046,14 @@ class PowerFactoryExporter:
 
             # Wiring group
             try:
-                vector_group = TVectorGroup[TrfVectorGroup(t_type.vecgrp).name]
+                vector_group = PF_VECTOR_GROUPS[t_type.vecgrp]
             except KeyError as e:
                 msg = f"Vector group {t_type.vecgrp} of transformer {name} is technically impossible. Aborting."
                 loguru.logger.error(msg)
                 raise RuntimeError from e
 
-            vector_group_h = WVectorGroup[TrfWindingVector(t_type.tr2cn_h).name]
-            vector_group_l = WVectorGroup[TrfWindingVector(t_type.tr2cn_l).name]
+            vector_group_h = PF_WINDING_VECTOR_GROUPS[t_type.tr2cn_h]
+            vector_group_l = PF_WINDING_VECTOR_GROUPS[t_type.tr2cn_l]
             vector_phase_angle_clock = t_type.nt2ag
 
             phases_1 = self.get_transformer2w_3ph_phases(winding_vector_group=vector_group_h, bus=transformer_2w.bushv)
@@ -1173,7 +1178,7 @@ class PowerFactoryExporter:
         voltage_ref_hv = round(voltage_ref_hv, DecimalDigits.VOLTAGE)
         voltage_ref_lv = round(voltage_ref_lv, DecimalDigits.VOLTAGE)
 
-        tap_side = TapSide[TrfTapSide(t_type.tap_side).name] if t_type.itapch else None
+        tap_side = TapSide[from_value(TrfTapSide, t_type.tap_side).name] if t_type.itapch else None
         tap_u_mag_perc = t_type.dutap
         if tap_side is TapSide.HV:
             tap_u_mag = tap_u_mag_perc / 100 * voltage_ref_hv
@@ -1451,7 +1456,9 @@ class PowerFactoryExporter:
         terminal = bus.cterm
 
         # PhaseConnectionType: either based on load type or on terminal phase connection type
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[LoadPhaseConnectionType(load.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(LoadPhaseConnectionType, load.phtech).name
+        ]
 
         # LoadModel
         u_0 = self.reference_voltage_for_load_model_of(load, u_nom=terminal.uknom * Exponents.VOLTAGE)
@@ -1573,7 +1580,9 @@ class PowerFactoryExporter:
         terminal = bus.cterm
 
         # PhaseConnectionType: either based on load type or on terminal phase connection type
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[LoadLVPhaseConnectionType(load.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(LoadLVPhaseConnectionType, load.phtech).name
+        ]
 
         # LoadModel
         u_0 = self.reference_voltage_for_load_model_of(load, u_nom=terminal.uknom * Exponents.VOLTAGE)
@@ -1673,7 +1682,9 @@ class PowerFactoryExporter:
         terminal = bus.cterm
 
         # PhaseConnectionType: either based on load type or on terminal phase connection type
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[LoadPhaseConnectionType(load.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(LoadPhaseConnectionType, load.phtech).name
+        ]
 
         # LoadModel
         u_0 = self.reference_voltage_for_load_model_of(load, u_nom=terminal.uknom * Exponents.VOLTAGE)
@@ -1766,10 +1777,10 @@ class PowerFactoryExporter:
 
         if load.GetClassName() is PFClassId.LOAD.value and load.typ_id is not None:
             voltage_system_type = VoltageSystemType[
-                ElementVoltageSystemType(t.cast("PFTypes.LoadType", load.typ_id).systp).name
+                from_value(ElementVoltageSystemType, t.cast("PFTypes.LoadType", load.typ_id).systp).name
             ]
         else:
-            voltage_system_type = VoltageSystemType[TerminalVoltageSystemType(terminal.systype).name]
+            voltage_system_type = VoltageSystemType[from_value(TerminalVoltageSystemType, terminal.systype).name]
 
         # Rated power and load models for active and reactive power
         power = power.limit_phases(n_phases=phase_connections.n_phases)
@@ -1966,8 +1977,10 @@ class PowerFactoryExporter:
     ) -> Load | None:
         power = self.calc_normal_gen_power(generator)
         gen_name = self.pfi.create_generator_name(generator)
-        system_type = SystemType[GeneratorSystemType(generator.aCategory).name]
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[GeneratorPhaseConnectionType(generator.phtech).name]
+        system_type = PF_GENERATOR_SYSTEM_TYPES[generator.aCategory]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(GeneratorPhaseConnectionType, generator.phtech).name
+        ]
 
         return self.create_producer(
             generator,
@@ -2000,7 +2013,9 @@ class PowerFactoryExporter:
     ) -> Load | None:
         power = self.calc_normal_gen_power(generator)
         gen_name = self.pfi.create_generator_name(generator)
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[GeneratorPhaseConnectionType(generator.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(GeneratorPhaseConnectionType, generator.phtech).name
+        ]
 
         return self.create_producer(
             generator,
@@ -2032,7 +2047,9 @@ class PowerFactoryExporter:
         cos_phi = gen.cosn
         # in PF for producer: ind. cos_phi = over excited; cap. cos_phi = under excited
         pow_fac_dir = PowerFactorDirection.UE if gen.pf_recap else PowerFactorDirection.OE
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[GeneratorPhaseConnectionType(gen.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(GeneratorPhaseConnectionType, gen.phtech).name
+        ]
         return LoadPower.from_sc_sym(
             pow_app=pow_app,
             cos_phi=cos_phi,
@@ -2711,7 +2728,9 @@ class PowerFactoryExporter:
         *,
         grid_name: str,
     ) -> LoadSSC | None:
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[LoadPhaseConnectionType(load.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(LoadPhaseConnectionType, load.phtech).name
+        ]
         power = self.calc_normal_load_power(load)
         if power is not None:
             return self.create_consumer_ssc(
@@ -2746,7 +2765,9 @@ class PowerFactoryExporter:
         scaling = load.scale0
         u_nom = None if load.bus1 is None else load.bus1.cterm.uknom
         pow_fac_dir = PowerFactorDirection.OE if load.pf_recap else PowerFactorDirection.UE
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[LoadPhaseConnectionType(load.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(LoadPhaseConnectionType, load.phtech).name
+        ]
         if load_type in ("DEF", "PQ"):
             return LoadPower.from_pq_sym(
                 pow_act=load.plini,
@@ -2986,7 +3007,9 @@ class PowerFactoryExporter:
             )
 
         subload_name = subload.loc_name if subload is not None else ""
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[LoadLVPhaseConnectionType(load.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(LoadLVPhaseConnectionType, load.phtech).name
+        ]
         consumer_fixed_ssc = (
             self.create_consumer_ssc(
                 load,
@@ -3050,7 +3073,9 @@ class PowerFactoryExporter:
         else:
             power_fixed = self.calc_load_lv_power_fixed_asym(load, scaling=scaling)
 
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[LoadLVPhaseConnectionType(load.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(LoadLVPhaseConnectionType, load.phtech).name
+        ]
 
         power_night = LoadPower.from_pq_sym(
             pow_act=load.pnight,
@@ -3084,7 +3109,9 @@ class PowerFactoryExporter:
         load: PFTypes.LoadLVP,
         /,
     ) -> LoadLVPower:
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[LoadLVPhaseConnectionType(load.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(LoadLVPhaseConnectionType, load.phtech).name
+        ]
         power_fixed = self.calc_load_lv_power_fixed_sym(load, scaling=1)
         power_night = LoadPower.from_pq_sym(
             pow_act=load.pnight,
@@ -3123,7 +3150,9 @@ class PowerFactoryExporter:
     ) -> LoadPower:
         load_type = load.iopt_inp
         pow_fac_dir = PowerFactorDirection.OE if load.pf_recap else PowerFactorDirection.UE
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[LoadLVPhaseConnectionType(load.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(LoadLVPhaseConnectionType, load.phtech).name
+        ]
         if load_type == IOpt.S_COSPHI:
             return LoadPower.from_sc_sym(
                 pow_app=load.slini,
@@ -3218,7 +3247,9 @@ class PowerFactoryExporter:
         *,
         grid_name: str,
     ) -> Sequence[LoadSSC | None]:
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[LoadPhaseConnectionType(load.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(LoadPhaseConnectionType, load.phtech).name
+        ]
         power = self.calc_load_mv_power(load)
         consumer_ssc = self.create_consumer_ssc(
             load,
@@ -3259,7 +3290,9 @@ class PowerFactoryExporter:
         pow_fac_dir_cons = PowerFactorDirection.OE if load.pf_recap else PowerFactorDirection.UE
         # in PF for producer: ind. cos_phi = over excited; cap. cos_phi = under excited
         pow_fac_dir_prod = PowerFactorDirection.UE if load.pfg_recap else PowerFactorDirection.OE
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[LoadPhaseConnectionType(load.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(LoadPhaseConnectionType, load.phtech).name
+        ]
         if load_type == "PC":
             power_consumer = LoadPower.from_pc_sym(
                 pow_act=load.plini,
@@ -3456,7 +3489,9 @@ class PowerFactoryExporter:
             )
             return None
 
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[GeneratorPhaseConnectionType(generator.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(GeneratorPhaseConnectionType, generator.phtech).name
+        ]
         phase_connections = self.get_load_phase_connections(
             phase_connection_type=phase_connection_type,
             bus=bus,
@@ -3569,7 +3604,9 @@ class PowerFactoryExporter:
         node_target_name = self.pfi.create_name(terminal, grid_name=grid_name)
         u_n = terminal.uknom * Exponents.VOLTAGE  # voltage in V
 
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[GeneratorPhaseConnectionType(gen.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(GeneratorPhaseConnectionType, gen.phtech).name
+        ]
         phase_connections = self.get_load_phase_connections(
             phase_connection_type=phase_connection_type,
             bus=bus,
@@ -3582,7 +3619,7 @@ class PowerFactoryExporter:
             )
 
         # Control mode
-        av_mode = LocalQCtrlMode(gen.av_mode)
+        av_mode = from_value(LocalQCtrlMode, gen.av_mode)
         if av_mode == LocalQCtrlMode.COSPHI_CONST:
             power = LoadPower.from_pc_sym(
                 pow_act=0,
@@ -3637,7 +3674,7 @@ class PowerFactoryExporter:
             q_max_ue = None
             q_max_oe = None
             q_control_type = ControlQP(
-                q_p_characteristic=Characteristic(name=gen.pQPcurve.loc_name),
+                q_p_characteristic=ControlTypeFactory.create_characteristic(gen.pQPcurve.loc_name),
                 q_max_ue=q_max_ue,
                 q_max_oe=q_max_oe,
             )
@@ -3699,7 +3736,9 @@ class PowerFactoryExporter:
         node_target_name = self.pfi.create_name(terminal, grid_name=grid_name)
         u_n = terminal.uknom * Exponents.VOLTAGE  # voltage in V
 
-        phase_connection_type = ConsolidatedLoadPhaseConnectionType[GeneratorPhaseConnectionType(gen.phtech).name]
+        phase_connection_type = ConsolidatedLoadPhaseConnectionType[
+            from_value(GeneratorPhaseConnectionType, gen.phtech).name
+        ]
         phase_connections = self.get_load_phase_connections(
             phase_connection_type=phase_connection_type,
             bus=bus,
@@ -3716,7 +3755,7 @@ class PowerFactoryExporter:
         if ctrl_mode == ExternalQCtrlMode.U:  # voltage control mode -> const. U
             q_control_type = ControlTypeFactory.create_u_const_sym(
                 u_set=controller.usetp * u_n,
-                u_meas_ref=ControlledVoltageRef[CtrlVoltageRef(controller.i_phase).name],
+                u_meas_ref=ControlledVoltageRef[from_value(CtrlVoltageRef, controller.i_phase).name],
             )
             return QController(
                 node_target=node_target_name,
@@ -3882,7 +3921,7 @@ class PowerFactoryExporter:
         if not bus.cPhInfo:
             msg = f"Mismatch of node and load phase technology at {self.pfi.create_name(bus, grid_name=grid_name)}."
             raise RuntimeError(msg)
-        t_phase_connection_type = TerminalPhaseConnectionType(bus.cterm.phtech)
+        t_phase_connection_type = from_value(TerminalPhaseConnectionType, bus.cterm.phtech)
         if t_phase_connection_type in (
             TerminalPhaseConnectionType.THREE_PH,
             TerminalPhaseConnectionType.THREE_PH_N,
@@ -3902,81 +3941,87 @@ class PowerFactoryExporter:
         if phase_connection_type == ConsolidatedLoadPhaseConnectionType.THREE_PH_D:
             return PhaseConnections(
                 value=[
-                    [Phase[PFPhase3PH(phases[0]).name], Phase[PFPhase3PH(phases[1]).name]],
-                    [Phase[PFPhase3PH(phases[1]).name], Phase[PFPhase3PH(phases[2]).name]],
-                    [Phase[PFPhase3PH(phases[2]).name], Phase[PFPhase3PH(phases[0]).name]],
+                    [Phase[from_value(PFPhase3PH, phases[0]).name], Phase[from_value(PFPhase3PH, phases[1]).name]],
+                    [Phase[from_value(PFPhase3PH, phases[1]).name], Phase[from_value(PFPhase3PH, phases[2]).name]],
+                    [Phase[from_value(PFPhase3PH, phases[2]).name], Phase[from_value(PFPhase3PH, phases[0]).name]],
                 ],
             )
 
         if phase_connection_type == ConsolidatedLoadPhaseConnectionType.THREE_PH_PH_E:
             return PhaseConnections(
                 value=[
-                    [Phase[PFPhase3PH(phases[0]).name], Phase.E],
-                    [Phase[PFPhase3PH(phases[1]).name], Phase.E],
-                    [Phase[PFPhase3PH(phases[2]).name], Phase.E],
+                    [Phase[from_value(PFPhase3PH, phases[0]).name], Phase.E],
+                    [Phase[from_value(PFPhase3PH, phases[1]).name], Phase.E],
+                    [Phase[from_value(PFPhase3PH, phases[2]).name], Phase.E],
                 ],
             )
 
         if phase_connection_type == ConsolidatedLoadPhaseConnectionType.THREE_PH_YN:
             return PhaseConnections(
                 value=[
-                    [Phase[PFPhase3PH(phases[0]).name], Phase.N],
-                    [Phase[PFPhase3PH(phases[1]).name], Phase.N],
-                    [Phase[PFPhase3PH(phases[2]).name], Phase.N],
+                    [Phase[from_value(PFPhase3PH, phases[0]).name], Phase.N],
+                    [Phase[from_value(PFPhase3PH, phases[1]).name], Phase.N],
+                    [Phase[from_value(PFPhase3PH, phases[2]).name], Phase.N],
                 ],
             )
 
         if phase_connection_type == ConsolidatedLoadPhaseConnectionType.TWO_PH_PH_E:
             if t_phase_connection_type in (TerminalPhaseConnectionType.TWO_PH, TerminalPhaseConnectionType.TWO_PH_N):
                 _phase_connections = [
-                    [Phase[PFPhase2PH(phases[0]).name], Phase.E],
-                    [Phase[PFPhase2PH(phases[1]).name], Phase.E],
+                    [Phase[from_value(PFPhase2PH, phases[0]).name], Phase.E],
+                    [Phase[from_value(PFPhase2PH, phases[1]).name], Phase.E],
                 ]
             else:
                 _phase_connections = [
-                    [Phase[PFPhase3PH(phases[0]).name], Phase.E],
-                    [Phase[PFPhase3PH(phases[1]).name], Phase.E],
+                    [Phase[from_value(PFPhase3PH, phases[0]).name], Phase.E],
+                    [Phase[from_value(PFPhase3PH, phases[1]).name], Phase.E],
                 ]
             return PhaseConnections(value=_phase_connections)
 
         if phase_connection_type == ConsolidatedLoadPhaseConnectionType.TWO_PH_YN:
             if t_phase_connection_type in (TerminalPhaseConnectionType.TWO_PH, TerminalPhaseConnectionType.TWO_PH_N):
                 _phase_connections = [
-                    [Phase[PFPhase2PH(phases[0]).name], Phase.N],
-                    [Phase[PFPhase2PH(phases[1]).name], Phase.N],
+                    [Phase[from_value(PFPhase2PH, phases[0]).name], Phase.N],
+                    [Phase[from_value(PFPhase2PH, phases[1]).name], Phase.N],
                 ]
             else:
                 _phase_connections = [
-                    [Phase[PFPhase3PH(phases[0]).name], Phase.N],
-                    [Phase[PFPhase3PH(phases[1]).name], Phase.N],
+                    [Phase[from_value(PFPhase3PH, phases[0]).name], Phase.N],
+                    [Phase[from_value(PFPhase3PH, phases[1]).name], Phase.N],
                 ]
             return PhaseConnections(value=_phase_connections)
 
         if phase_connection_type == ConsolidatedLoadPhaseConnectionType.ONE_PH_PH_PH:
             if t_phase_connection_type in (TerminalPhaseConnectionType.ONE_PH, TerminalPhaseConnectionType.ONE_PH_N):
-                _phase_connections = [[Phase[PFPhase1PH(phases[0]).name], Phase[PFPhase1PH(phases[1]).name]]]
+                _phase_connections = [
+                    [Phase[from_value(PFPhase1PH, phases[0]).name], Phase[from_value(PFPhase1PH, phases[1]).name]],
+                ]
             elif t_phase_connection_type in (TerminalPhaseConnectionType.TWO_PH, TerminalPhaseConnectionType.TWO_PH_N):
-                _phase_connections = [[Phase[PFPhase2PH(phases[0]).name], Phase[PFPhase2PH(phases[1]).name]]]
+                _phase_connections = [
+                    [Phase[from_value(PFPhase2PH, phases[0]).name], Phase[from_value(PFPhase2PH, phases[1]).name]],
+                ]
             else:
-                _phase_connections = [[Phase[PFPhase3PH(phases[0]).name], Phase[PFPhase3PH(phases[1]).name]]]
+                _phase_connections = [
+                    [Phase[from_value(PFPhase3PH, phases[0]).name], Phase[from_value(PFPhase3PH, phases[1]).name]],
+                ]
             return PhaseConnections(value=_phase_connections)
 
         if phase_connection_type == ConsolidatedLoadPhaseConnectionType.ONE_PH_PH_E:
             if t_phase_connection_type in (TerminalPhaseConnectionType.ONE_PH, TerminalPhaseConnectionType.ONE_PH_N):
-                _phase_connections = [[Phase[PFPhase1PH(phases[0]).name], Phase.E]]
+                _phase_connections = [[Phase[from_value(PFPhase1PH, phases[0]).name], Phase.E]]
             elif t_phase_connection_type in (TerminalPhaseConnectionType.TWO_PH, TerminalPhaseConnectionType.TWO_PH_N):
-                _phase_connections = [[Phase[PFPhase2PH(phases[0]).name], Phase.E]]
+                _phase_connections = [[Phase[from_value(PFPhase2PH, phases[0]).name], Phase.E]]
             else:
-                _phase_connections = [[Phase[PFPhase3PH(phases[0]).name], Phase.E]]
+                _phase_connections = [[Phase[from_value(PFPhase3PH, phases[0]).name], Phase.E]]
             return PhaseConnections(value=_phase_connections)
 
         if phase_connection_type == ConsolidatedLoadPhaseConnectionType.ONE_PH_PH_N:
             if t_phase_connection_type in (TerminalPhaseConnectionType.ONE_PH, TerminalPhaseConnectionType.ONE_PH_N):
-                _phase_connections = [[Phase[PFPhase1PH(phases[0]).name], Phase.N]]
+                _phase_connections = [[Phase[from_value(PFPhase1PH, phases[0]).name], Phase.N]]
             elif t_phase_connection_type in (TerminalPhaseConnectionType.TWO_PH, TerminalPhaseConnectionType.TWO_PH_N):
-                _phase_connections = [[Phase[PFPhase2PH(phases[0]).name], Phase.N]]
+                _phase_connections = [[Phase[from_value(PFPhase2PH, phases[0]).name], Phase.N]]
             else:
-                _phase_connections = [[Phase[PFPhase3PH(phases[0]).name], Phase.N]]
+                _phase_connections = [[Phase[from_value(PFPhase3PH, phases[0]).name], Phase.N]]
             return PhaseConnections(value=_phase_connections)
 
         msg = "unreachable"
@@ -4000,38 +4045,38 @@ class PowerFactoryExporter:
         if l_type.nlnph == 3:  # 3 phase conductors  # noqa: PLR2004
             phases = textwrap.wrap(bus.cPhInfo, 2)
             phases_tuple = [
-                Phase[PFPhase3PH(phases[0]).name],
-                Phase[PFPhase3PH(phases[1]).name],
-                Phase[PFPhase3PH(phases[2]).name],
+                Phase[from_value(PFPhase3PH, phases[0]).name],
+                Phase[from_value(PFPhase3PH, phases[1]).name],
+                Phase[from_value(PFPhase3PH, phases[2]).name],
             ]
         elif l_type.nlnph == 2:  # 2 phase conductors  # noqa: PLR2004
             if phase_connection_type in (TerminalPhaseConnectionType.THREE_PH, TerminalPhaseConnectionType.THREE_PH_N):
                 phases = textwrap.wrap(bus.cPhInfo, 2)
                 phases_tuple = [
-                    Phase[PFPhase3PH(phases[0]).name],
-                    Phase[PFPhase3PH(phases[1]).name],
+                    Phase[from_value(PFPhase3PH, phases[0]).name],
+                    Phase[from_value(PFPhase3PH, phases[1]).name],
                 ]
             if phase_connection_type in (TerminalPhaseConnectionType.TWO_PH, TerminalPhaseConnectionType.TWO_PH_N):
                 phases = textwrap.wrap(bus.cPhInfo, 3)
                 phases_tuple = [
-                    Phase[PFPhase2PH(phases[0]).name],
-                    Phase[PFPhase2PH(phases[1]).name],
+                    Phase[from_value(PFPhase2PH, phases[0]).name],
+                    Phase[from_value(PFPhase2PH, phases[1]).name],
                 ]
         elif l_type.nlnph == 1:  # 1 phase conductors
             if phase_connection_type in (TerminalPhaseConnectionType.THREE_PH, TerminalPhaseConnectionType.THREE_PH_N):
                 phases = textwrap.wrap(bus.cPhInfo, 2)
                 phases_tuple = [
-                    Phase[PFPhase3PH(phases[0]).name],
+                    Phase[from_value(PFPhase3PH, phases[0]).name],
                 ]
             if phase_connection_type in (TerminalPhaseConnectionType.TWO_PH, TerminalPhaseConnectionType.TWO_PH_N):
                 phases = textwrap.wrap(bus.cPhInfo, 3)
                 phases_tuple = [
-                    Phase[PFPhase2PH(phases[0]).name],
+                    Phase[from_value(PFPhase2PH, phases[0]).name],
                 ]
             elif phase_connection_type in (TerminalPhaseConnectionType.ONE_PH, TerminalPhaseConnectionType.ONE_PH_N):
                 phases = textwrap.wrap(bus.cPhInfo, 2)
                 phases_tuple = [
-                    Phase[PFPhase1PH(phases[0]).name],
+                    Phase[from_value(PFPhase1PH, phases[0]).name],
                 ]
         else:
             msg = "unreachable"
@@ -4091,20 +4136,20 @@ class PowerFactoryExporter:
         if phase_connection_type in (TerminalPhaseConnectionType.THREE_PH, TerminalPhaseConnectionType.THREE_PH_N):
             phases = textwrap.wrap(bus.cPhInfo, 2)
             return [
-                Phase[PFPhase3PH(phases[0]).name],
-                Phase[PFPhase3PH(phases[1]).name],
-                Phase[PFPhase3PH(phases[2]).name],
+                Phase[from_value(PFPhase3PH, phases[0]).name],
+                Phase[from_value(PFPhase3PH, phases[1]).name],
+                Phase[from_value(PFPhase3PH, phases[2]).name],
             ]
 
         if phase_connection_type in (TerminalPhaseConnectionType.TWO_PH, TerminalPhaseConnectionType.TWO_PH_N):
             phases = textwrap.wrap(bus.cPhInfo, 3)
             return [
-                Phase[PFPhase2PH(phases[0]).name],
-                Phase[PFPhase2PH(phases[1]).name],
+                Phase[from_value(PFPhase2PH, phases[0]).name],
+                Phase[from_value(PFPhase2PH, phases[1]).name],
             ]
         if phase_connection_type in (TerminalPhaseConnectionType.ONE_PH, TerminalPhaseConnectionType.ONE_PH_N):
             phases = textwrap.wrap(bus.cPhInfo, 2)
-            return [Phase[PFPhase1PH(phases[0]).name]]
+            return [Phase[from_value(PFPhase1PH, phases[0]).name]]
         if phase_connection_type in (TerminalPhaseConnectionType.BI, TerminalPhaseConnectionType.BI_N):
             msg = "Implementation unclear. Please extend exporter by your own."
             raise RuntimeError(msg)
@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 import enum
-import itertools
+import functools
 import math
 import typing as t
 from dataclasses import dataclass
@@ -49,6 +49,11 @@ if t.TYPE_CHECKING:
         power_reactive_control_type: QControlStrategy
 
 
+# resolved once at import, the as_*_ssc methods round every phase value of every load
+_POWER_DIGITS = DecimalDigits.POWER
+_POWERFACTOR_DIGITS = DecimalDigits.POWERFACTOR
+
+
 class ConsolidatedLoadPhaseConnectionType(enum.Enum):
     ONE_PH_PH_E = "ONE_PH_PH_E"
     ONE_PH_PH_N = "ONE_PH_PH_N"
@@ -62,7 +67,20 @@ class ConsolidatedLoadPhaseConnectionType(enum.Enum):
     TWO_PH_YN = "TWO_PH_YN"
 
 
-@dataclass
+# Number of phases and per-phase share for each connection type, looked up for every load power created
+_LOAD_PHASE_FACTORS: dict[ConsolidatedLoadPhaseConnectionType, tuple[int, tuple[int, ...]]] = {
+    ConsolidatedLoadPhaseConnectionType.THREE_PH_D: (3, (1, 1, 1)),
+    ConsolidatedLoadPhaseConnectionType.THREE_PH_PH_E: (3, (1, 1, 1)),
+    ConsolidatedLoadPhaseConnectionType.THREE_PH_YN: (3, (1, 1, 1)),
+    ConsolidatedLoadPhaseConnectionType.TWO_PH_PH_E: (2, (1, 1)),
+    ConsolidatedLoadPhaseConnectionType.TWO_PH_YN: (2, (1, 1)),
+    ConsolidatedLoadPhaseConnectionType.ONE_PH_PH_E: (1, (1,)),
+    ConsolidatedLoadPhaseConnectionType.ONE_PH_PH_N: (1, (1,)),
+    ConsolidatedLoadPhaseConnectionType.ONE_PH_PH_PH: (1, (1,)),
+}
+
+
+@dataclass(slots=True)
 class LoadPower:
     pow_apps: tuple[float, ...]
     pow_acts: tuple[float, ...]
@@ -73,7 +91,8 @@ class LoadPower:
 
     @staticmethod
     def _is_symmetrical(values: tuple[float, ...]) -> bool:
-        return len(list(itertools.groupby(values))) in (0, 1)
+        # all phases are equal iff every value equals its successor
+        return values[1:] == values[:-1]
 
     @property
     def pow_app(self) -> float:
@@ -347,26 +366,11 @@ class LoadPower:
     def get_factors_for_phases(
         phase_connection_type: ConsolidatedLoadPhaseConnectionType,
     ) -> tuple[int, tuple[int, ...]]:
-        if phase_connection_type in (
-            ConsolidatedLoadPhaseConnectionType.THREE_PH_D,
-            ConsolidatedLoadPhaseConnectionType.THREE_PH_PH_E,
-            ConsolidatedLoadPhaseConnectionType.THREE_PH_YN,
-        ):
-            return (3, (1, 1, 1))
-        if phase_connection_type in (
-            ConsolidatedLoadPhaseConnectionType.TWO_PH_PH_E,
-            ConsolidatedLoadPhaseConnectionType.TWO_PH_YN,
-        ):
-            return (2, (1, 1))
-        if phase_connection_type in (
-            ConsolidatedLoadPhaseConnectionType.ONE_PH_PH_E,
-            ConsolidatedLoadPhaseConnectionType.ONE_PH_PH_N,
-            ConsolidatedLoadPhaseConnectionType.ONE_PH_PH_PH,
-        ):
-            return (1, (1,))
-
-        msg = "unreachable"
-        raise RuntimeError(msg)
+        try:
+            return _LOAD_PHASE_FACTORS[phase_connection_type]
+        except KeyError as e:
+            msg = "unreachable"
+            raise RuntimeError(msg) from e
 
     @classmethod
     def from_pq_sym(
@@ -712,14 +716,14 @@ class LoadPower:
 
     def as_active_power_ssc(self) -> ActivePower:
         return ActivePower(
-            value=(round(e, DecimalDigits.POWER) for e in self.pow_acts),
+            value=(round(e, _POWER_DIGITS) for e in self.pow_acts),
             system_type=SystemType.NATURAL,
         )
 
     def as_reactive_power_ssc(self) -> ReactivePower:
         # remark: actual reactive power indirectly (Q(U); Q(P)) set by external controller is not shown in ReactivePower
         return ReactivePower(
-            value=(round(e, DecimalDigits.POWER) for e in self.pow_reacts),
+            value=(round(e, _POWER_DIGITS) for e in self.pow_reacts),
             system_type=SystemType.NATURAL,
         )
 
@@ -729,10 +733,10 @@ class LoadPower:
         # * as loads don't have rated power in a classic way
         # An adaption may be necessary in the future if inductive coils or capacitor banks are considered.
         pow_apps = ApparentPower(
-            value=(round(e, DecimalDigits.POWER) for e in self.pow_apps),
+            value=(round(e, _POWER_DIGITS) for e in self.pow_apps),
             system_type=SystemType.NATURAL,
         )
-        cos_phis = CosPhi(value=(round(e, DecimalDigits.POWERFACTOR) for e in self.cos_phis))
+        cos_phis = CosPhi(value=(round(e, _POWERFACTOR_DIGITS) for e in self.cos_phis))
         return RatedPower.from_apparent_power(pow_apps, cos_phis)
 
     def limit_phases(self, n_phases: int) -> LoadPower:
@@ -839,11 +843,17 @@ class ControlTypeFactory:
         if q_max_oe is not None:
             q_max_oe = Qc.sym_three_phase_reactive_power(q_max_oe)
         return ControlQP(
-            q_p_characteristic=Characteristic(name=q_p_characteristic_name),
+            q_p_characteristic=ControlTypeFactory.create_characteristic(q_p_characteristic_name),
             q_max_ue=q_max_ue,
             q_max_oe=q_max_oe,
         )
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def create_characteristic(name: str) -> Characteristic:
+        # psdm characteristics are frozen, so all controllers following the same curve can share one instance
+        return Characteristic(name=name)
+
     @staticmethod
     def create_u_const_sym(
         u_set: float,
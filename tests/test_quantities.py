@@ -0,0 +1,20 @@
+# :author: Sasan Jacob Rasti <sasan_jacob.rasti@tu-dresden.de>
+# :author: Sebastian Krahmer <sebastian.krahmer@tu-dresden.de>
+# :copyright: Copyright (c) Institute of Electrical Power Systems and High Voltage Engineering - TU Dresden, 2022-2024.
+# :license: BSD 3-Clause
+
+import json
+
+import pytest
+
+from powerfactory_tools.versions.pf2022.quantities import QuantityConverter as QuantityConverter2022
+from powerfactory_tools.versions.pf2024.quantities import QuantityConverter as QuantityConverter2024
+
+
+@pytest.mark.parametrize("converter", [QuantityConverter2022, QuantityConverter2024])
+def test_signed_zero_does_not_depend_on_call_order(converter) -> None:
+    positive = converter.sym_three_phase_reactive_power(0.0)
+    negative = converter.sym_three_phase_reactive_power(-0.0)
+
+    assert str(json.loads(positive.model_dump_json())["value"]) == "[0.0, 0.0, 0.0]"
+    assert str(json.loads(negative.model_dump_json())["value"]) == "[-0.0, -0.0, -0.0]"